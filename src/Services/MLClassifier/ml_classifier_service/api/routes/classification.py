@@ -1,10 +1,18 @@
 """Classification routes for task classification API."""
 
+import asyncio
 import logging
+import math
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, Optional, Sequence
 
 from api.schemas.classification import ClassificationRequest, ClassificationResult
 from domain.classifiers.heuristic import HeuristicClassifier
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 logger = logging.getLogger(__name__)
 
@@ -13,14 +21,76 @@ router = APIRouter(prefix="/classify", tags=["Classification"])
 # Initialize the heuristic classifier (singleton)
 heuristic_classifier = HeuristicClassifier()
 
+# Batches with at least this many distinct tasks are split across the
+# worker process pool
+PROCESS_POOL_MIN_BATCH = 64
+
+# (task description, files changed) pairs as sent to worker processes
+Task = tuple[str, Optional[Sequence[str]]]
+
+
+def init_worker() -> None:
+    """
+    Warm up a process pool worker.
+
+    Workers are spawned, so each one imports this module and builds its own
+    classifier and result cache; nothing is inherited from the parent.
+    """
+    heuristic_classifier.warmup()
+
+
+def create_process_pool(pool_size: int) -> ProcessPoolExecutor:
+    """
+    Create the worker process pool for large batches.
+
+    Workers are spawned rather than forked from the server process, which
+    already runs the event loop and the threadpool.
+
+    Args:
+        pool_size: Number of worker processes
+
+    Returns:
+        Process pool whose workers run init_worker on start
+    """
+    return ProcessPoolExecutor(
+        max_workers=pool_size,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+    )
+
+
+async def start_workers(pool: Executor, pool_size: int) -> None:
+    """
+    Start every worker of a process pool before it receives a batch.
+
+    ProcessPoolExecutor only spawns workers as tasks are submitted, so one
+    no-op task is submitted per worker and awaited.
+
+    Args:
+        pool: Pool created by create_process_pool
+        pool_size: Number of workers in the pool
+    """
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *(loop.run_in_executor(pool, _worker_ready) for _ in range(pool_size))
+    )
+
+
+def _worker_ready() -> None:
+    """No-op task submitted to each worker by start_workers."""
+
 
 @router.post("/", response_model=ClassificationResult)
-async def classify_task(request: ClassificationRequest) -> ClassificationResult:
+def classify_task(request: ClassificationRequest) -> Response:
     """
     Classify a coding task.
 
     Uses heuristic classification based on keyword matching.
     Returns task type, complexity, confidence, and execution recommendations.
+    The X-Cache response header reports whether the result was cached.
+
+    Declared as a plain function so FastAPI runs the CPU-bound classification
+    on its threadpool instead of blocking the event loop.
 
     Args:
         request: Classification request with task description
@@ -35,14 +105,22 @@ async def classify_task(request: ClassificationRequest) -> ClassificationResult:
         logger.info(f"Classifying task: {request.task_description[:50]}...")
 
         # Use heuristic classifier (Phase 1 - ML/LLM will be added later)
-        result = heuristic_classifier.classify(request.task_description)
+        result, cache_hit = heuristic_classifier.classify_cached(
+            request.task_description, request.files_changed
+        )
 
         logger.info(
             f"Classification complete: type={result.task_type.value}, "
-            f"complexity={result.complexity.value}, confidence={result.confidence:.2f}"
+            f"complexity={result.complexity.value}, confidence={result.confidence:.2f}, "
+            f"cache_hit={cache_hit}"
         )
 
-        return result
+        # Return the result's pre-serialized JSON, skipping response encoding
+        return Response(
+            content=result.json_bytes(),
+            media_type="application/json",
+            headers={"X-Cache": "HIT" if cache_hit else "MISS"},
+        )
 
     except Exception as e:
         logger.error(f"Classification failed: {str(e)}", exc_info=True)
@@ -54,13 +132,24 @@ async def classify_task(request: ClassificationRequest) -> ClassificationResult:
 
 @router.post("/batch", response_model=list[ClassificationResult])
 async def classify_tasks_batch(
+    http_request: Request,
     requests: list[ClassificationRequest],
-) -> list[ClassificationResult]:
+    stream: bool = False,
+) -> Response:
     """
     Classify multiple tasks in batch.
 
+    Batches of PROCESS_POOL_MIN_BATCH distinct tasks or more are split across
+    the worker process pool created at startup; smaller batches run on the
+    FastAPI threadpool. If a pool worker has died, the pool is replaced and
+    the batch runs on the threadpool. With ``?stream=true`` results are
+    streamed as NDJSON (one result per line) as they are produced, instead
+    of as a single JSON array.
+
     Args:
+        http_request: Incoming HTTP request, used to reach the process pool
         requests: List of classification requests
+        stream: Stream results as NDJSON instead of returning a JSON array
 
     Returns:
         List of classification results
@@ -71,14 +160,41 @@ async def classify_tasks_batch(
     try:
         logger.info(f"Batch classifying {len(requests)} tasks...")
 
-        results = []
-        for request in requests:
-            result = heuristic_classifier.classify(request.task_description)
-            results.append(result)
+        if stream:
+            return StreamingResponse(
+                _stream_results(requests), media_type="application/x-ndjson"
+            )
+
+        tasks = [
+            (request.task_description, request.files_changed) for request in requests
+        ]
+        pool = getattr(http_request.app.state, "classifier_pool", None)
+
+        if pool is not None and len(tasks) >= PROCESS_POOL_MIN_BATCH:
+            pool_size = http_request.app.state.classifier_pool_size
+            try:
+                encoded = await _classify_in_pool(pool, pool_size, tasks)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed) and the pool accepts no more
+                # work. Concurrent batches may all see the broken pool, so
+                # only the first replaces it; the new workers start on the
+                # next large batch.
+                logger.warning("Classifier process pool broken; replacing it")
+                if http_request.app.state.classifier_pool is pool:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    http_request.app.state.classifier_pool = create_process_pool(
+                        pool_size
+                    )
+                encoded = await run_in_threadpool(classify_encoded, tasks)
+        else:
+            encoded = await run_in_threadpool(classify_encoded, tasks)
 
-        logger.info(f"Batch classification complete: {len(results)} tasks processed")
+        logger.info(f"Batch classification complete: {len(encoded)} tasks processed")
 
-        return results
+        return Response(
+            content=b"[" + b",".join(encoded) + b"]",
+            media_type="application/json",
+        )
 
     except Exception as e:
         logger.error(f"Batch classification failed: {str(e)}", exc_info=True)
@@ -86,3 +202,86 @@ async def classify_tasks_batch(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Batch classification failed: {str(e)}",
         )
+
+
+def classify_encoded(tasks: list[Task]) -> list[bytes]:
+    """
+    Classify tasks with this process's classifier and encode the results.
+
+    Runs both in-process and in pool workers; returning JSON bytes keeps
+    the results cheap to pickle back from a worker.
+
+    Args:
+        tasks: (task description, files changed) pairs
+
+    Returns:
+        JSON-encoded classification results in input order
+    """
+    results = heuristic_classifier.classify_many(
+        [description for description, _ in tasks],
+        [files for _, files in tasks],
+    )
+    return [result.json_bytes() for result in results]
+
+
+async def _classify_in_pool(
+    pool: Executor, pool_size: int, tasks: list[Task]
+) -> list[bytes]:
+    """
+    Classify a batch across the worker process pool.
+
+    Duplicate tasks are removed first, since each worker has its own result
+    cache, and the distinct tasks are split evenly so every worker gets one
+    chunk. Batches that dedup below PROCESS_POOL_MIN_BATCH run in-process.
+
+    Args:
+        pool: Worker process pool created at startup
+        pool_size: Number of workers in the pool
+        tasks: (task description, files changed) pairs
+
+    Returns:
+        JSON-encoded classification results in input order
+    """
+    keys = [
+        (description, None if files is None else tuple(files))
+        for description, files in tasks
+    ]
+    unique = list(dict.fromkeys(keys))
+    if len(unique) < PROCESS_POOL_MIN_BATCH:
+        return await run_in_threadpool(classify_encoded, tasks)
+
+    chunk_size = math.ceil(len(unique) / pool_size)
+    loop = asyncio.get_running_loop()
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                pool, classify_encoded, unique[start : start + chunk_size]
+            )
+            for start in range(0, len(unique), chunk_size)
+        )
+    )
+    encoded = dict(
+        zip(unique, (line for chunk in chunks for line in chunk), strict=True)
+    )
+    return [encoded[key] for key in keys]
+
+
+def _stream_results(requests: list[ClassificationRequest]) -> Iterator[bytes]:
+    """
+    Classify tasks one at a time, yielding each result as an NDJSON line.
+
+    Repeated descriptions are served from the classifier's result cache,
+    whose results keep their encoded JSON, so nothing is held per batch.
+
+    Args:
+        requests: List of classification requests
+
+    Yields:
+        JSON-encoded classification result followed by a newline
+    """
+    for request in requests:
+        result = heuristic_classifier.classify(
+            request.task_description, request.files_changed
+        )
+        yield result.json_bytes() + b"\n"
+    logger.info(f"Batch classification streamed: {len(requests)} tasks processed")
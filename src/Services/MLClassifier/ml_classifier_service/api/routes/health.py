@@ -1,5 +1,6 @@
 """Health check and service status routes."""
 
+from api.routes.classification import heuristic_classifier
 from fastapi import APIRouter
 from pydantic import BaseModel
 
@@ -7,11 +8,20 @@ from pydantic import BaseModel
 router = APIRouter(prefix="", tags=["Health"])
 
 
+class CacheStats(BaseModel):
+    """Classifier result cache statistics for this worker process."""
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
 class HealthResponse(BaseModel):
     """Health check response model."""
     status: str
     service: str
     version: str
+    cache: CacheStats
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -19,12 +29,14 @@ async def health_check() -> HealthResponse:
     """
     Health check endpoint.
     
-    Returns service status and version information.
+    Returns service status, version information and classifier cache
+    statistics for the worker that served the request.
     """
     return HealthResponse(
         status="healthy",
         service="ML Classifier",
-        version="2.0.0"
+        version="2.0.0",
+        cache=CacheStats(**heuristic_classifier.cache_stats())
     )
 
 
@@ -3,7 +3,7 @@
 from typing import Optional
 
 from domain.models.task_type import TaskComplexity, TaskType
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ClassificationRequest(BaseModel):
@@ -51,6 +51,8 @@ class ClassificationResult(BaseModel):
         None, description="Which classifier was used (heuristic/ml/llm)"
     )
 
+    _json: Optional[bytes] = PrivateAttr(default=None)
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -66,3 +68,17 @@ class ClassificationResult(BaseModel):
             ]
         }
     }
+
+    def json_bytes(self) -> bytes:
+        """
+        Serialize the result to JSON, reusing the bytes on later calls.
+
+        Cached results are shared between requests, so each one is encoded
+        only once.
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        if self._json is None:
+            self._json = self.model_dump_json().encode()
+        return self._json
@@ -1,145 +1,432 @@
 """Heuristic classifier using keyword matching for fast classification."""
 
+import hashlib
 import re
-from typing import Dict, List
+import threading
+from itertools import islice
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, Union
 
+import ahocorasick
 from api.schemas.classification import ClassificationResult
+from cachetools import LFUCache
 from domain.models.task_type import TaskComplexity, TaskType
 
+# Runs of non-whitespace, used to count words without splitting
+_WORD_RE = re.compile(r"\S+")
+
+# Characters that case-insensitive regex matching treats as ASCII letters
+# but str.lower() does not fold to them ("İ" even lowers to two code points)
+_ASCII_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+# Execution strategy per complexity level
+_STRATEGY: Dict[TaskComplexity, str] = {
+    TaskComplexity.SIMPLE: "SingleShot",
+    TaskComplexity.MEDIUM: "Iterative",
+    TaskComplexity.COMPLEX: "MultiAgent",
+}
+
+# Estimated token usage per complexity level
+_TOKENS: Dict[TaskComplexity, int] = {
+    TaskComplexity.SIMPLE: 2000,
+    TaskComplexity.MEDIUM: 6000,
+    TaskComplexity.COMPLEX: 20000,
+}
+
 
 class HeuristicClassifier:
     """Fast keyword-based classification (90% accuracy, 5ms latency)."""
 
-    # Keyword patterns for each task type
+    # Keywords for each task type: lowercase literals matched as whole words.
+    # "|" separates variants of one keyword, which count as a single match
     KEYWORDS: Dict[TaskType, List[str]] = {
         TaskType.BUG_FIX: [
-            r"\bbug\b",
-            r"\berror\b",
-            r"\bfix\b",
-            r"\bcrash\b",
-            r"\bissue\b",
-            r"\bfail(s|ing|ed)?\b",
-            r"\bbroken\b",
-            r"\bdefect\b",
-            r"\bproblem\b",
-            r"\bincorrect\b",
+            "bug",
+            "error",
+            "fix",
+            "crash",
+            "issue",
+            "fail|fails|failing|failed",
+            "broken",
+            "defect",
+            "problem",
+            "incorrect",
         ],
         TaskType.FEATURE: [
-            r"\badd\b",
-            r"\bimplement\b",
-            r"\bcreate\b",
-            r"\bnew\b",
-            r"\bfeature\b",
-            r"\benhance\b",
-            r"\bsupport\b",
-            r"\bintroduce\b",
-            r"\bextend\b",
-            r"\bbuild\b",
+            "add",
+            "implement",
+            "create",
+            "new",
+            "feature",
+            "enhance",
+            "support",
+            "introduce",
+            "extend",
+            "build",
         ],
         TaskType.REFACTOR: [
-            r"\brefactor\b",
-            r"\bclean\b",
-            r"\boptimize\b",
-            r"\bimprove\b",
-            r"\breorganize\b",
-            r"\brestructure\b",
-            r"\bsimplify\b",
-            r"\bmodernize\b",
-            r"\bupgrade\b",
+            "refactor",
+            "clean",
+            "optimize",
+            "improve",
+            "reorganize",
+            "restructure",
+            "simplify",
+            "modernize",
+            "upgrade",
         ],
         TaskType.TEST: [
-            r"\btest\b",
-            r"\bunit test\b",
-            r"\bintegration test\b",
-            r"\bcoverage\b",
-            r"\bspec\b",
-            r"\bvalidate\b",
-            r"\bverify\b",
-            r"\bmock\b",
-            r"\bassertion\b",
+            "test",
+            "unit test",
+            "integration test",
+            "coverage",
+            "spec",
+            "validate",
+            "verify",
+            "mock",
+            "assertion",
         ],
         TaskType.DOCUMENTATION: [
-            r"\bdoc(s|umentation)?\b",
-            r"\breadme\b",
-            r"\bcomment\b",
-            r"\bexplain\b",
-            r"\bdescribe\b",
-            r"\bguide\b",
-            r"\btutorial\b",
-            r"\bexample\b",
-            r"\bannotate\b",
+            "doc|docs|documentation",
+            "readme",
+            "comment",
+            "explain",
+            "describe",
+            "guide",
+            "tutorial",
+            "example",
+            "annotate",
         ],
         TaskType.DEPLOYMENT: [
-            r"\bdeploy\b",
-            r"\brelease\b",
-            r"\bci/cd\b",
-            r"\bpipeline\b",
-            r"\bdocker\b",
-            r"\bkubernetes\b",
-            r"\bhelm\b",
-            r"\bcontainer\b",
-            r"\binfrastructure\b",
+            "deploy",
+            "release",
+            "ci/cd",
+            "pipeline",
+            "docker",
+            "kubernetes",
+            "helm",
+            "container",
+            "infrastructure",
         ],
     }
 
     # Complexity indicators
     COMPLEXITY_KEYWORDS = {
         "simple": [
-            r"\bsmall\b",
-            r"\bquick\b",
-            r"\bminor\b",
-            r"\btrivial\b",
-            r"\btypo\b",
-            r"\bone[ -]line\b",
-            r"\bsimple\b",
+            "small",
+            "quick",
+            "minor",
+            "trivial",
+            "typo",
+            "one line|one-line",
+            "simple",
         ],
         "complex": [
-            r"\bcomplex\b",
-            r"\bmajor\b",
-            r"\barchitecture\b",
-            r"\brewrite\b",
-            r"\bmigration\b",
-            r"\brefactor all\b",
-            r"\blarge[ -]scale\b",
-            r"\bentire\b",
-            r"\bsystem[ -]wide\b",
+            "complex",
+            "major",
+            "architecture",
+            "rewrite",
+            "migration",
+            "refactor all",
+            "large scale|large-scale",
+            "entire",
+            "system wide|system-wide",
         ],
     }
 
-    def __init__(self):
-        """Initialize the heuristic classifier with compiled regex patterns."""
-        # Compile regex patterns for performance
-        self.compiled_keywords = {
-            task_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
-            for task_type, patterns in self.KEYWORDS.items()
-        }
-        self.compiled_complexity = {
-            level: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
-            for level, patterns in self.COMPLEXITY_KEYWORDS.items()
-        }
+    # Changing more files than this marks a task as complex outright
+    LARGE_CHANGE_FILE_COUNT = 10
+
+    # Descriptions longer than this (in characters) are cached under a
+    # SHA-256 digest so cache memory stays bounded per entry
+    CACHE_KEY_DIGEST_THRESHOLD = 256
+
+    def __init__(self, cache_size: int = 10_000):
+        """
+        Initialize the heuristic classifier with Aho-Corasick automata.
+
+        Args:
+            cache_size: Maximum number of classification results to cache
+        """
+        # Task types by integer slot (KEYWORDS order, which also breaks ties)
+        self._task_types: List[TaskType] = list(self.KEYWORDS)
+
+        # Build one automaton per keyword table so a single pass over the
+        # description finds every keyword; task keywords carry their slot
+        self._keyword_automaton = self._build_automaton(
+            dict(enumerate(self.KEYWORDS.values()))
+        )
+        self._complexity_automaton = self._build_automaton(self.COMPLEXITY_KEYWORDS)
+
+        # LFU cache of results keyed by task description (or its digest, see
+        # _cache_key) and whether the change is large; popular task
+        # templates stay resident while one-off descriptions are evicted
+        self._cache: LFUCache = LFUCache(maxsize=cache_size)
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @staticmethod
+    def _build_automaton(
+        groups: Dict[Hashable, List[str]],
+    ) -> ahocorasick.Automaton:
+        """
+        Build an Aho-Corasick automaton over keyword groups.
+
+        Each variant of a keyword maps to a ``(variant, targets)`` payload.
+        ``targets`` lists a ``(key, index)`` pair for every keyword the variant
+        belongs to, where ``index`` is the keyword's position in its group, so
+        matches can be tallied per keyword rather than per variant and a
+        literal listed under several keys counts for each of them.
+
+        Args:
+            groups: Mapping of group key to its lowercase keywords
+
+        Returns:
+            Finalized automaton ready for searching
+        """
+        targets: Dict[str, List[Tuple[Hashable, int]]] = {}
+        for key, keywords in groups.items():
+            for index, keyword in enumerate(keywords):
+                for variant in keyword.split("|"):
+                    targets.setdefault(variant, []).append((key, index))
+
+        # add_word() replaces the payload of a repeated literal, so every
+        # literal is added once with all of its targets
+        automaton = ahocorasick.Automaton()
+        for variant, variant_targets in targets.items():
+            automaton.add_word(variant, (variant, variant_targets))
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _iter_words(
+        automaton: ahocorasick.Automaton, text: str
+    ) -> Iterator[Tuple[Hashable, int, str]]:
+        """
+        Yield whole-word keyword matches in order of appearance.
+
+        Args:
+            automaton: Automaton built by ``_build_automaton``
+            text: Lowercased text to scan
+
+        Yields:
+            ``(key, index, variant)`` for each keyword of each match
+        """
+        last = len(text) - 1
+        for end, (variant, targets) in automaton.iter(text):
+            # Emulate regex \b: reject matches embedded in a larger word
+            start = end - len(variant) + 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end < last and _is_word_char(text[end + 1]):
+                continue
+            for key, index in targets:
+                yield key, index, variant
+
+    @classmethod
+    def _scan(
+        cls, automaton: ahocorasick.Automaton, text: str, size: int
+    ) -> List[Dict[int, str]]:
+        """
+        Scan text once and collect the distinct whole-word keywords per slot.
+
+        Args:
+            automaton: Automaton built by ``_build_automaton`` with integer keys
+            text: Lowercased text to scan
+            size: Number of slots (keys are ``0..size-1``)
+
+        Returns:
+            Per slot, the matched keyword indexes mapped to the first variant
+            seen, in order of appearance
+        """
+        matched: List[Dict[int, str]] = [{} for _ in range(size)]
+        for slot, index, variant in cls._iter_words(automaton, text):
+            matched[slot].setdefault(index, variant)
+        return matched
 
-    def classify(self, task_description: str) -> ClassificationResult:
+    def classify(
+        self, task_description: str, files_changed: Optional[Sequence[str]] = None
+    ) -> ClassificationResult:
         """
         Classify task using keyword matching.
 
         Args:
             task_description: The description of the task to classify
+            files_changed: Optional paths of the files the task will change
+
+        Returns:
+            ClassificationResult with task type, complexity, and confidence
+        """
+        result, _ = self.classify_cached(task_description, files_changed)
+        return result
+
+    def classify_cached(
+        self, task_description: str, files_changed: Optional[Sequence[str]] = None
+    ) -> Tuple[ClassificationResult, bool]:
+        """
+        Classify task, reusing the result for a previously seen description.
+
+        Args:
+            task_description: The description of the task to classify
+            files_changed: Optional paths of the files the task will change
+
+        Returns:
+            Tuple of the ClassificationResult and whether it was a cache hit
+        """
+        return self._classify_cached(
+            task_description, self._is_large_change(files_changed)
+        )
+
+    def classify_many(
+        self,
+        task_descriptions: Sequence[str],
+        files_changed: Optional[Sequence[Optional[Sequence[str]]]] = None,
+    ) -> List[ClassificationResult]:
+        """
+        Classify several tasks, scanning each distinct description once.
+
+        Args:
+            task_descriptions: Descriptions of the tasks to classify
+            files_changed: Optional changed file paths per task, aligned
+                with task_descriptions
+
+        Returns:
+            ClassificationResults in the same order as the input
+
+        Raises:
+            ValueError: If files_changed and task_descriptions differ in length
+        """
+        if files_changed is None:
+            files_changed = [None] * len(task_descriptions)
+        keys = [
+            (description, self._is_large_change(files))
+            for description, files in zip(task_descriptions, files_changed, strict=True)
+        ]
+        unique = dict.fromkeys(keys)
+        for key in unique:
+            unique[key], _ = self._classify_cached(*key)
+        return [unique[key] for key in keys]
+
+    def warmup(self) -> None:
+        """
+        Run a throwaway classification so the first request is not cold.
+
+        Exercises the keyword automata and result serialization without
+        touching the result cache or its statistics.
+        """
+        self._classify("Warmup: fix the bug in the new feature", False).json_bytes()
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Report result cache usage.
+
+        Returns:
+            Dictionary with cache hits, misses, current size and max size
+        """
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._cache),
+                "maxsize": int(self._cache.maxsize),
+            }
+
+    def _is_large_change(self, files_changed: Optional[Sequence[str]]) -> bool:
+        """
+        Check whether a task touches enough files to be complex outright.
+
+        Args:
+            files_changed: Optional paths of the files the task will change
+
+        Returns:
+            True if more than LARGE_CHANGE_FILE_COUNT files are changed
+        """
+        return files_changed is not None and (
+            len(files_changed) > self.LARGE_CHANGE_FILE_COUNT
+        )
+
+    def _cache_key(self, task_description: str) -> Union[str, bytes]:
+        """
+        Build the result cache key for a task description.
+
+        Args:
+            task_description: The description of the task to classify
+
+        Returns:
+            The description itself, or its SHA-256 digest if it is longer
+            than CACHE_KEY_DIGEST_THRESHOLD
+        """
+        if len(task_description) <= self.CACHE_KEY_DIGEST_THRESHOLD:
+            return task_description
+        return hashlib.sha256(task_description.encode()).digest()
+
+    def _classify_cached(
+        self, task_description: str, large_change: bool
+    ) -> Tuple[ClassificationResult, bool]:
+        """
+        Look up or compute the result for a description and change size.
+
+        Args:
+            task_description: The description of the task to classify
+            large_change: Whether the task changes many files
+
+        Returns:
+            Tuple of the ClassificationResult and whether it was a cache hit
+        """
+        key = (self._cache_key(task_description), large_change)
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache_hits += 1
+                return result, True
+            self._cache_misses += 1
+
+        result = self._classify(task_description, large_change)
+
+        with self._cache_lock:
+            self._cache[key] = result
+
+        return result, False
+
+    def _classify(
+        self, task_description: str, large_change: bool
+    ) -> ClassificationResult:
+        """
+        Classify task using keyword matching, bypassing the cache.
+
+        Args:
+            task_description: The description of the task to classify
+            large_change: Whether the task changes many files, which makes it
+                complex without scanning for complexity keywords
 
         Returns:
             ClassificationResult with task type, complexity, and confidence
         """
-        # Count keyword matches per task type
-        match_counts = {}
-        for task_type, patterns in self.compiled_keywords.items():
-            count = sum(1 for pattern in patterns if pattern.search(task_description))
-            if count > 0:
-                match_counts[task_type] = count
+        # Lowercase once; both keyword scans match lowercase literals
+        description = task_description.translate(_ASCII_FOLD).lower()
+
+        # Count keyword matches per task type slot
+        matched = self._scan(
+            self._keyword_automaton, description, len(self._task_types)
+        )
+        counts = [len(keywords) for keywords in matched]
+        scored = _score(counts)
+
+        # A large file count is decisive, so skip the complexity scan
+        complexity = (
+            TaskComplexity.COMPLEX
+            if large_change
+            else self._classify_complexity(description)
+        )
+
+        # Results are built from known-valid values, so skip pydantic
+        # validation with model_construct
 
         # No matches - default to FEATURE with low confidence
-        if not match_counts:
-            return ClassificationResult(
+        if scored is None:
+            return ClassificationResult.model_construct(
                 task_type=TaskType.FEATURE,
-                complexity=self._classify_complexity(task_description),
+                complexity=complexity,
                 confidence=0.3,
                 reasoning="No keyword matches found, defaulting to FEATURE",
                 suggested_strategy="Iterative",
@@ -147,31 +434,15 @@ class HeuristicClassifier:
                 classifier_used="heuristic",
             )
 
-        # Get task type with most matches
-        predicted_type = max(match_counts, key=match_counts.get)
-        max_matches = match_counts[predicted_type]
-
-        # Calculate confidence based on match count and uniqueness
-        total_matches = sum(match_counts.values())
-        base_confidence = max_matches / total_matches if total_matches > 0 else 0
-
-        # Boost confidence if matches are unique to one type
-        if len(match_counts) == 1:
-            confidence = min(0.95, base_confidence + 0.2)
-        else:
-            confidence = min(0.85, base_confidence)
-
-        complexity = self._classify_complexity(task_description)
+        best, confidence = scored
+        predicted_type = self._task_types[best]
+        max_matches = counts[best]
 
         # Build reasoning message
-        matched_patterns = [
-            pattern.pattern
-            for pattern in self.compiled_keywords[predicted_type]
-            if pattern.search(task_description)
-        ]
-        reasoning = f"Matched {max_matches} keywords for {predicted_type.value}: {', '.join(matched_patterns[:3])}"
+        matched_keywords = list(matched[best].values())
+        reasoning = f"Matched {max_matches} keywords for {predicted_type.value}: {', '.join(matched_keywords[:3])}"
 
-        return ClassificationResult(
+        return ClassificationResult.model_construct(
             task_type=predicted_type,
             complexity=complexity,
             confidence=confidence,
@@ -186,30 +457,25 @@ class HeuristicClassifier:
         Classify complexity based on indicators.
 
         Args:
-            description: Task description
+            description: Lowercased task description
 
         Returns:
             TaskComplexity enum value
         """
-        # Check for explicit complexity keywords
-        simple_matches = sum(
-            1
-            for pattern in self.compiled_complexity["simple"]
-            if pattern.search(description)
-        )
-        complex_matches = sum(
-            1
-            for pattern in self.compiled_complexity["complex"]
-            if pattern.search(description)
-        )
+        # Check for explicit complexity keywords; a complex indicator wins
+        # outright, so stop scanning at the first one
+        has_simple = False
+        for level, _, _ in self._iter_words(self._complexity_automaton, description):
+            if level == "complex":
+                return TaskComplexity.COMPLEX
+            has_simple = True
 
-        if complex_matches > 0:
-            return TaskComplexity.COMPLEX
-        elif simple_matches > 0:
+        if has_simple:
             return TaskComplexity.SIMPLE
 
-        # Use length as heuristic
-        word_count = len(description.split())
+        # Use length as heuristic; only the 20 and 100 word thresholds
+        # matter, so stop counting once past the upper one
+        word_count = sum(1 for _ in islice(_WORD_RE.finditer(description), 101))
         if word_count < 20:
             return TaskComplexity.SIMPLE
         elif word_count > 100:
@@ -227,11 +493,7 @@ class HeuristicClassifier:
         Returns:
             Strategy name as string
         """
-        return {
-            TaskComplexity.SIMPLE: "SingleShot",
-            TaskComplexity.MEDIUM: "Iterative",
-            TaskComplexity.COMPLEX: "MultiAgent",
-        }[complexity]
+        return _STRATEGY[complexity]
 
     def _estimate_tokens(self, complexity: TaskComplexity) -> int:
         """
@@ -243,8 +505,38 @@ class HeuristicClassifier:
         Returns:
             Estimated token count
         """
-        return {
-            TaskComplexity.SIMPLE: 2000,
-            TaskComplexity.MEDIUM: 6000,
-            TaskComplexity.COMPLEX: 20000,
-        }[complexity]
+        return _TOKENS[complexity]
+
+
+def _score(counts: Sequence[int]) -> Optional[Tuple[int, float]]:
+    """
+    Pick the winning task type slot and its confidence in a single pass.
+
+    Args:
+        counts: Keyword match count per task type slot
+
+    Returns:
+        Tuple of the winning slot (first slot wins ties) and confidence,
+        or None if no keywords matched
+    """
+    best, max_matches, total_matches = 0, 0, 0
+    for index, count in enumerate(counts):
+        total_matches += count
+        if count > max_matches:
+            best, max_matches = index, count
+
+    if not total_matches:
+        return None
+
+    # Calculate confidence based on match count and uniqueness
+    base_confidence = max_matches / total_matches
+
+    # Boost confidence if matches are unique to one type
+    if max_matches == total_matches:
+        return best, min(0.95, base_confidence + 0.2)
+    return best, min(0.85, base_confidence)
+
+
+def _is_word_char(char: str) -> bool:
+    r"""Return True if char counts as a word character for regex ``\b``."""
+    return char.isalnum() or char == "_"
@@ -1,11 +1,15 @@
 """Main FastAPI application for ML Classifier service."""
 
 import logging
+import os
+import time
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from api.routes import classification, health
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 
 # Configure logging
@@ -14,6 +18,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Worker threads available to sync route handlers (AnyIO defaults to 40)
+THREADPOOL_SIZE = 64
+
+
+def _int_env(name: str, default: int, minimum: int) -> int:
+    """
+    Read an integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value to use when the variable is unset
+        minimum: Smallest accepted value
+
+    Returns:
+        The configured value, or default if the variable is unset
+
+    Raises:
+        ValueError: If the variable is not an integer of at least minimum
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = None
+    if number is None or number < minimum:
+        raise ValueError(f"{name} must be an integer >= {minimum}, got {value!r}")
+    return number
+
+
+def _process_pool_size() -> int:
+    """
+    Size the batch classification process pool.
+
+    CLASSIFIER_POOL_SIZE overrides the size. Otherwise the CPUs are shared
+    out across the uvicorn workers (WEB_CONCURRENCY, as read by uvicorn), so
+    each worker's pool does not oversubscribe the host.
+
+    Returns:
+        Number of pool worker processes
+
+    Raises:
+        ValueError: If either variable is set to an invalid value
+    """
+    uvicorn_workers = _int_env("WEB_CONCURRENCY", 1, minimum=1)
+    default = (os.cpu_count() or 1) // uvicorn_workers
+    return _int_env("CLASSIFIER_POOL_SIZE", default, minimum=0)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -21,12 +74,41 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting ML Classifier Service...")
     logger.info("Heuristic classifier initialized")
+
+    # Large batches are classified across worker processes. A single worker
+    # would only add pickling overhead, so the pool needs at least two.
+    pool_size = _process_pool_size()
+    app.state.classifier_pool = None
+    app.state.classifier_pool_size = pool_size
+
+    # Warm the classifier, and start the pool workers, so the first request
+    # after startup is not cold
+    warmup_start = time.perf_counter()
+    classification.heuristic_classifier.warmup()
+    if pool_size >= 2:
+        app.state.classifier_pool = classification.create_process_pool(pool_size)
+        await classification.start_workers(app.state.classifier_pool, pool_size)
+        logger.info(f"Classifier process pool started with {pool_size} workers")
+    else:
+        logger.info("Classifier process pool disabled; batches run in-process")
+    logger.info(
+        f"Heuristic classifier warmed up in "
+        f"{(time.perf_counter() - warmup_start) * 1000:.1f}ms"
+    )
+
+    # Classification handlers are sync and run on the AnyIO threadpool
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = THREADPOOL_SIZE
+    logger.info(f"Threadpool size set to {limiter.total_tokens}")
     # Future: Load ML models, connect to database, start event consumers
 
     yield
 
     # Shutdown
     logger.info("Shutting down ML Classifier Service...")
+    if app.state.classifier_pool is not None:
+        app.state.classifier_pool.shutdown(cancel_futures=True)
+        app.state.classifier_pool = None
     # Future: Close database connections, stop event consumers
 
 
@@ -36,6 +118,8 @@ app = FastAPI(
     description="Task classification service using heuristic and ML approaches",
     version="2.0.0",
     lifespan=lifespan,
+    # Encode JSON responses with orjson instead of the stdlib encoder
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -59,6 +143,25 @@ Instrumentator().instrument(app).expose(
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True, log_level="info")
+    # Auto-reload for development; set UVICORN_RELOAD=false to run one
+    # worker process per CPU instead (or WEB_CONCURRENCY workers)
+    reload = os.getenv("UVICORN_RELOAD", "true").lower() == "true"
+    if not reload:
+        # Exported so each worker's lifespan sizes its process pool to match
+        os.environ.setdefault("WEB_CONCURRENCY", str(os.cpu_count() or 1))
+
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        # uvloop has no Windows build, so fall back to asyncio there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=reload,
+        workers=None if reload else _int_env("WEB_CONCURRENCY", 1, minimum=1),
+        log_level="info",
+    )
@@ -1,10 +1,23 @@
 """Integration tests for the classification API."""
 
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 import pytest
+from api.routes.classification import PROCESS_POOL_MIN_BATCH
 from fastapi.testclient import TestClient
 from main import app
 
 
+class BrokenPool(Executor):
+    """Executor that fails like a process pool whose worker has died."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Reject every task as a broken process pool does."""
+        raise BrokenProcessPool("A worker process terminated abruptly")
+
+
 @pytest.fixture
 def client():
     """Create a test client for the FastAPI app."""
@@ -23,6 +36,7 @@ class TestClassificationAPI:
         assert data["status"] == "healthy"
         assert data["service"] == "ML Classifier"
         assert data["version"] == "2.0.0"
+        assert set(data["cache"]) == {"hits", "misses", "size", "maxsize"}
 
     def test_root_endpoint(self, client):
         """Test the root endpoint."""
@@ -75,6 +89,37 @@ class TestClassificationAPI:
         data = response.json()
         assert data["task_type"] in ["bug_fix", "feature"]
 
+    def test_classify_cache_header(self, client):
+        """Test that repeated requests report a cache hit."""
+        request = {"task_description": "Fix the flaky cache header integration test"}
+
+        first = client.post("/classify/", json=request)
+        second = client.post("/classify/", json=request)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert first.json() == second.json()
+
+    def test_classify_batch_duplicates(self, client):
+        """Test that duplicate batch entries keep their position in the results."""
+        requests = [
+            {"task_description": "Fix the login bug"},
+            {"task_description": "Deploy to production"},
+            {"task_description": "Fix the login bug"},
+        ]
+
+        response = client.post("/classify/batch", json=requests)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["task_type"] for item in data] == [
+            "bug_fix",
+            "deployment",
+            "bug_fix",
+        ]
+
     def test_classify_batch(self, client):
         """Test batch classification endpoint."""
         requests = [
@@ -91,6 +136,77 @@ class TestClassificationAPI:
         assert all("task_type" in item for item in data)
         assert all("confidence" in item for item in data)
 
+    def test_classify_large_batch_process_pool(self, monkeypatch):
+        """Test that large batches are classified through the process pool."""
+        # Size the pool explicitly; on a single-CPU host it would be disabled
+        monkeypatch.setenv("CLASSIFIER_POOL_SIZE", "2")
+        requests = [
+            {"task_description": f"Fix login bug number {index}"}
+            for index in range(PROCESS_POOL_MIN_BATCH + 6)
+        ]
+        # Duplicates must come back in their original positions
+        requests += [
+            {"task_description": "Deploy to production"},
+            {"task_description": "Fix login bug number 0"},
+            {"task_description": "Deploy to production"},
+        ]
+
+        # Entering the client runs the lifespan, which starts the pool
+        with TestClient(app) as client:
+            assert app.state.classifier_pool is not None
+            response = client.post("/classify/batch", json=requests)
+
+        assert app.state.classifier_pool is None
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == len(requests)
+        assert all(item["task_type"] == "bug_fix" for item in data[:-3])
+        assert [item["task_type"] for item in data[-3:]] == [
+            "deployment",
+            "bug_fix",
+            "deployment",
+        ]
+
+    def test_classify_large_batch_replaces_broken_pool(self, monkeypatch):
+        """Test that a broken process pool is replaced without failing batches."""
+        monkeypatch.setenv("CLASSIFIER_POOL_SIZE", "2")
+        requests = [
+            {"task_description": f"Fix login bug number {index}"}
+            for index in range(PROCESS_POOL_MIN_BATCH)
+        ]
+
+        with TestClient(app) as client:
+            app.state.classifier_pool.shutdown()
+            app.state.classifier_pool = BrokenPool()
+
+            broken_response = client.post("/classify/batch", json=requests)
+            replaced_pool = app.state.classifier_pool
+            response = client.post("/classify/batch", json=requests)
+
+        assert isinstance(replaced_pool, ProcessPoolExecutor)
+        assert broken_response.status_code == 200
+        assert response.status_code == 200
+        assert broken_response.json() == response.json()
+
+    def test_classify_batch_stream(self, client):
+        """Test batch classification streamed as NDJSON."""
+        requests = [
+            {"task_description": "Fix the login bug"},
+            {"task_description": "Add user profile feature"},
+            {"task_description": "Fix the login bug"},
+        ]
+
+        response = client.post("/classify/batch?stream=true", json=requests)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [item["task_type"] for item in lines] == [
+            "bug_fix",
+            "feature",
+            "bug_fix",
+        ]
+
     def test_classify_empty_description(self, client):
         """Test classification with empty description."""
         request = {"task_description": ""}
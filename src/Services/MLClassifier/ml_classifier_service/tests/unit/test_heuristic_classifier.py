@@ -1,6 +1,7 @@
 """Unit tests for heuristic classifier."""
 
 import pytest
+from api.schemas.classification import ClassificationResult
 from domain.classifiers.heuristic import HeuristicClassifier
 from domain.models.task_type import TaskComplexity, TaskType
 
@@ -24,6 +25,56 @@ class TestHeuristicClassifier:
         assert result.classifier_used == "heuristic"
         assert "bug" in result.reasoning.lower() or "fix" in result.reasoning.lower()
 
+    def test_reasoning_lists_matched_keywords(self, classifier):
+        """Test that reasoning names the keywords found in the scan."""
+        description = "Deploy the release pipeline with Docker and Helm"
+        result = classifier.classify(description)
+
+        assert result.task_type == TaskType.DEPLOYMENT
+        assert result.reasoning == (
+            "Matched 5 keywords for deployment: deploy, release, pipeline"
+        )
+
+    def test_keyword_variants_count_once(self, classifier):
+        """Test that several variants of one keyword count as one match."""
+        result = classifier.classify("The test fails and failed again")
+
+        # One bug_fix keyword (fail*) against one test keyword
+        assert result.task_type == TaskType.BUG_FIX
+        assert result.confidence == pytest.approx(0.5)
+        assert result.reasoning == "Matched 1 keywords for bug_fix: fails"
+
+    def test_nested_keywords_both_count(self, classifier):
+        """Test that a keyword inside a longer keyword is still counted."""
+        result = classifier.classify("add unit test")
+
+        # "unit test" and "test" against "add"
+        assert result.task_type == TaskType.TEST
+        assert result.confidence == pytest.approx(2 / 3)
+
+    def test_shared_keyword_counts_for_each_type(self):
+        """Test that a literal listed under two task types counts for both."""
+
+        class SharedKeywordClassifier(HeuristicClassifier):
+            KEYWORDS = {
+                **HeuristicClassifier.KEYWORDS,
+                TaskType.TEST: [*HeuristicClassifier.KEYWORDS[TaskType.TEST], "fix"],
+            }
+
+        result = SharedKeywordClassifier().classify("fix")
+
+        # One match each for bug_fix and test; the tie goes to KEYWORDS order
+        assert result.task_type == TaskType.BUG_FIX
+        assert result.confidence == pytest.approx(0.5)
+
+    @pytest.mark.parametrize("description", ["İssue", "ıssue", "ISSUE"])
+    def test_non_ascii_case_matches_keywords(self, classifier, description):
+        """Test that letters regex IGNORECASE treats as ASCII still match."""
+        result = classifier.classify(description)
+
+        assert result.task_type == TaskType.BUG_FIX
+        assert result.confidence == pytest.approx(0.95)
+
     def test_classify_feature(self, classifier):
         """Test classification of a feature task."""
         description = (
@@ -102,6 +153,29 @@ class TestHeuristicClassifier:
         assert result.suggested_strategy == "MultiAgent"
         assert result.estimated_tokens == 20000
 
+    def test_classify_complexity_by_length(self, classifier):
+        """Test length-based complexity when no complexity keywords match."""
+        short = classifier.classify("Fix the login bug")
+        medium = classifier.classify("Fix the login bug\t" + "word\n" * 40)
+        long = classifier.classify("Fix the login bug " + "word " * 120)
+
+        assert short.complexity == TaskComplexity.SIMPLE
+        assert medium.complexity == TaskComplexity.MEDIUM
+        assert long.complexity == TaskComplexity.COMPLEX
+
+    def test_classify_many_files_is_complex(self, classifier):
+        """Test that changing many files marks a task as complex."""
+        description = "Fix a small typo in the login form"
+        files = [f"src/module_{index}.py" for index in range(11)]
+
+        few = classifier.classify(description, files[:2])
+        many = classifier.classify(description, files)
+
+        assert few.complexity == TaskComplexity.SIMPLE
+        assert many.complexity == TaskComplexity.COMPLEX
+        assert many.suggested_strategy == "MultiAgent"
+        assert many.task_type == few.task_type
+
     def test_classify_no_matches(self, classifier):
         """Test classification when no keywords match."""
         description = "Do something unspecified"
@@ -121,6 +195,14 @@ class TestHeuristicClassifier:
         assert result.task_type in [TaskType.BUG_FIX, TaskType.FEATURE]
         assert result.confidence > 0.0
 
+    def test_confidence_split_between_types(self, classifier):
+        """Test confidence when matches are shared between task types."""
+        result = classifier.classify("Fix the bug in the new feature")
+
+        # Two keywords each for bug_fix and feature; the earlier type wins
+        assert result.task_type == TaskType.BUG_FIX
+        assert result.confidence == pytest.approx(0.5)
+
     def test_confidence_score_range(self, classifier):
         """Test that confidence scores are within valid range."""
         descriptions = [
@@ -142,3 +224,110 @@ class TestHeuristicClassifier:
         result = classifier.classify(description)
 
         assert result.estimated_tokens > 0
+
+    @pytest.mark.parametrize(
+        "description",
+        ["Fix a small typo in the login form", "Do something unspecified"],
+    )
+    def test_result_serializes_like_validated_model(self, classifier, description):
+        """Test that unvalidated results serialize like validated ones."""
+        result = classifier.classify(description)
+        validated = ClassificationResult(**result.model_dump())
+
+        assert result.model_dump_json() == validated.model_dump_json()
+
+    def test_json_bytes_serialized_once(self, classifier):
+        """Test that cached results reuse their serialized JSON."""
+        result = classifier.classify("Fix the login bug")
+
+        encoded = result.json_bytes()
+
+        assert encoded == result.model_dump_json().encode()
+        assert classifier.classify("Fix the login bug").json_bytes() is encoded
+
+    def test_classify_cached_reuses_result(self, classifier):
+        """Test that repeated descriptions are served from the cache."""
+        description = "Fix the login bug"
+
+        first, first_hit = classifier.classify_cached(description)
+        second, second_hit = classifier.classify_cached(description)
+
+        assert first_hit is False
+        assert second_hit is True
+        assert second is first
+
+    def test_classify_cache_evicts_least_frequently_used(self):
+        """Test that the cache is bounded by cache_size."""
+        classifier = HeuristicClassifier(cache_size=2)
+
+        classifier.classify("Fix the login bug")
+        classifier.classify("Add user profile feature")
+        classifier.classify("Fix the login bug")
+        classifier.classify("Write unit tests")
+
+        _, hit = classifier.classify_cached("Fix the login bug")
+        assert hit is True
+        _, hit = classifier.classify_cached("Add user profile feature")
+        assert hit is False
+
+    def test_classify_many_preserves_order(self, classifier):
+        """Test that batch classification deduplicates but keeps input order."""
+        descriptions = [
+            "Fix the login bug",
+            "Deploy to production",
+            "Fix the login bug",
+        ]
+
+        results = classifier.classify_many(descriptions)
+
+        assert [result.task_type for result in results] == [
+            TaskType.BUG_FIX,
+            TaskType.DEPLOYMENT,
+            TaskType.BUG_FIX,
+        ]
+        assert results[0] is results[2]
+        assert classifier.cache_stats()["misses"] == 2
+
+    def test_warmup_bypasses_cache(self, classifier):
+        """Test that warmup does not populate the result cache."""
+        classifier.warmup()
+
+        stats = classifier.cache_stats()
+
+        assert stats["size"] == 0
+        assert stats["hits"] == 0
+        assert stats["misses"] == 0
+
+    def test_long_description_cached_by_digest(self, classifier):
+        """Test that long descriptions are cached without keeping the text."""
+        description = "Fix the login bug " + "details " * 100
+
+        first, first_hit = classifier.classify_cached(description)
+        second, second_hit = classifier.classify_cached(description)
+        _, other_hit = classifier.classify_cached(description + "more")
+
+        assert (first_hit, second_hit, other_hit) == (False, True, False)
+        assert second is first
+        assert all(
+            not isinstance(key, str)
+            or len(key) <= classifier.CACHE_KEY_DIGEST_THRESHOLD
+            for key, _ in classifier._cache
+        )
+
+    def test_classify_many_rejects_misaligned_files(self, classifier):
+        """Test that files_changed must line up with the descriptions."""
+        with pytest.raises(ValueError):
+            classifier.classify_many(["Fix the login bug", "Add a feature"], [None])
+
+    def test_cache_stats(self, classifier):
+        """Test that cache hits and misses are counted."""
+        classifier.classify("Fix the login bug")
+        classifier.classify("Fix the login bug")
+        classifier.classify("Add user profile feature")
+
+        stats = classifier.cache_stats()
+
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["size"] == 2
+        assert stats["maxsize"] == 10_000